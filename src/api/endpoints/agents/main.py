@@ -74,7 +74,9 @@ async def contract_analyzer_endpoint(file: UploadFile, session_id: str = Header(
     """Analyze a contract document and extract key information."""
 
     document = Document(io.BytesIO(await file.read()))
-    document_data = "\n".join([para.text for para in document.paragraphs if para.text.strip() != ""])
+    # python-docx rebuilds paragraph.text from the XML runs on every access, so read it once.
+    paragraph_texts = (para.text for para in document.paragraphs)
+    document_data = "\n".join(text for text in paragraph_texts if text.strip())
 
     analysis_result: ContractAnalyzerResponse = await contract_analyzer_service(content=document_data, session_id=session_id)
     return analysis_result
@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     gemini_api_key: Union[str, None] = Field(default=None, description="API key for Gemini LLM Model.")
     gemini_embedding_model: str = Field(default="gemini-embedding-001", description="Gemini Embedding model used.")
     gemini_text_generation_model: str = Field(default="gemini-2.5-flash-lite-preview-09-2025", description="Gemini model for Query Rewriting task.")
+    embedding_concurrency: int = Field(default=8, description="Max embedding batch requests in flight at once for remote embedding APIs.")
 
     # OpenAI Settings
     openai_api_key: Union[str, None] = Field(default=None, description="API Key  for the OPENAI Models.")
@@ -38,6 +39,12 @@ class Settings(BaseSettings):
     hugggingface_minilm_embedding_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", description="Hugging Face Embedding Model.")  # 384
     hugggingface_qwen_embedding_model: str = Field(default="Qwen/Qwen3-Embedding-0.6B", description="Qwen3 0.6B model from Hugging Face.")
     huggingface_jina_embedding_model: str = Field(default="jina-embeddings-v3", description="Jina Embedding model from HuggingFace.")
+    # The embedding cache is process-wide: vectors derived from uploaded contracts
+    # stay in memory across sessions, and after a session is cleaned up, until evicted.
+    embedding_cache_size: int = Field(
+        default=10000,
+        description="Max number of chunk embeddings kept in memory, keyed by SHA-256 of the text. Entries outlive the sessions that produced them; 0 disables the cache.",
+    )
 
     # Jina Embeddings
     jina_embedding_model_uri: str = Field(default="https://api.jina.ai/v1/embeddings", description="Jina-Embedding model URI.")
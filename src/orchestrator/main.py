@@ -1,6 +1,5 @@
 import inspect
 import json
-from pathlib import Path
 from typing import Any, Dict, Optional
 
 from agent_framework import (
@@ -15,6 +14,7 @@ from agent_framework._tools import FUNCTION_INVOKING_CHAT_CLIENT_MARKER
 
 from src.dependencies import get_service_container, initialize_dependencies
 from src.services.llm.azure_openai_model import AzureOpenAIModel
+from src.services.prompts.v1 import get_prompt_template
 from src.tools.key_information import get_key_information
 from src.tools.summarizer import get_summary
 
@@ -195,7 +195,7 @@ class OpenAIChat(BaseChatClient):
         )
 
 
-prompt = Path(r"src\services\prompts\v1\orchestrator_prompt.mustache").read_text()
+prompt = get_prompt_template("orchestrator_prompt")
 
 agent = OpenAIChat().create_agent(
     name="Orchestrator Agent",
@@ -1,6 +1,5 @@
 import asyncio
 import sys
-from pathlib import Path
 
 if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -9,13 +8,12 @@ from agent_framework import ChatAgent
 from agent_framework.openai import OpenAIResponsesClient
 
 from src.config.settings import get_settings
+from src.services.prompts.v1 import get_prompt_template
 from src.tools.key_information import get_key_information
 from src.tools.summarizer import get_summary
 
 settings = get_settings()
 
-prompt = Path(r"src\services\prompts\v1\orchestrator_prompt.mustache").read_text()
-
 
 async def get_azure_agent() -> ChatAgent:
 
@@ -25,7 +23,7 @@ async def get_azure_agent() -> ChatAgent:
             api_key=settings.azure_openai_api_key,
             base_url=settings.base_url,
         ),
-        instructions=prompt,
+        instructions=get_prompt_template("orchestrator_prompt"),
         tools=[get_summary, get_key_information],
     )
 
@@ -56,23 +56,9 @@ class IngestionService(Logger):
             parsed_data.processing_time = time.time() - start_time
             self.logger.info(f"Data parsed in {parsed_data.processing_time:.2f} seconds for the provided data.")
 
-        # Index the chunks in the vector store
+        # The parser has already embedded the chunks and added their vectors to the
+        # session (or global) vector store in chunk order; only the chunks are stored here.
         if parsed_data.chunks:
-            # Generate embeddings for each chunk and index them
-            for chunk in parsed_data.chunks:
-                # Generate embedding for the chunk content
-                embedding = await self.embedding_service.generate_embeddings(text=chunk.content, task="text-matching")
-
-                # Index embedding into the appropriate vector store
-                if session_data:
-                    await session_data.vector_store.index_embedding(embedding)
-                else:
-                    # For global indexing, use the global vector store
-                    from src.services.vector_store.manager import get_faiss_vector_store
-
-                    global_store = get_faiss_vector_store(self.embedding_service.get_embedding_dimensions())
-                    await global_store.index_embedding(embedding)
-
             # Index chunks into chunk store
             if session_data:
                 # Per-session indexing (include document metadata)
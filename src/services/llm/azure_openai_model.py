@@ -3,11 +3,12 @@ Azure OpenAI LLM client with retry logic, structured JSON responses,
 and Mustache template rendering.
 """
 
+import asyncio
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type
 
-import pystache
 from openai import (
     APIConnectionError,
     APITimeoutError,
@@ -35,11 +36,29 @@ from src.exceptions.llm_exceptions import (
     ResponseParsingError,
 )
 from src.services.llm.base_model import BaseLLMModel
+from src.services.prompts.v1 import render_prompt
 
 RETRYABLE_ERRORS = (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError)
 _retry_logger = logging.getLogger("AI_Contract.AzureOpenAI")
 
 
+@lru_cache(maxsize=None)
+def json_schema_response_format(response_model: Type) -> Dict[str, Any]:
+    """Build the ``json_schema`` response_format for a Pydantic model once per process.
+
+    ``model_json_schema()`` regenerates the schema on every call, and the result
+    never changes for a given model class.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_model.__name__,
+            "schema": response_model.model_json_schema(),
+            "strict": False,
+        },
+    }
+
+
 class AzureOpenAIModel(BaseLLMModel, Logger):
     """Azure OpenAI client for structured JSON generation and chat completion."""
 
@@ -64,9 +83,9 @@ class AzureOpenAIModel(BaseLLMModel, Logger):
         """Render a Mustache template with HTML escaping disabled.
 
         Escaping is disabled because prompts are sent to the LLM, not rendered as HTML.
+        The renderer is shared across calls instead of being rebuilt per request.
         """
-        renderer = pystache.Renderer(escape=lambda u: u)
-        return renderer.render(prompt, context)
+        return render_prompt(prompt, context)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -87,13 +106,18 @@ class AzureOpenAIModel(BaseLLMModel, Logger):
         if self.deployment_name is None:
             raise ValueError("Deployment name is not configured.")
 
-        prompt = self.render_prompt_template(prompt=prompt, context=context)
-        self.logger.debug(f"Rendered prompt for LLM: {prompt}")
+        # An empty context means the caller already rendered the prompt (e.g. via
+        # load_prompt); rendering again would cost a second pass and strip any
+        # literal {{...}} that came in with user or document text.
+        if context:
+            prompt = self.render_prompt_template(prompt=prompt, context=context)
+        self.logger.debug("Rendered prompt for LLM: %s", prompt)
 
         try:
-            json_schema = response_model.model_json_schema()
-
-            response = self.client.chat.completions.create(
+            # The SDK client is synchronous; run it on a worker thread so a long
+            # completion does not block the event loop for other requests.
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.deployment_name,
                 messages=[
                     {"role": "system", "content": system_message},
@@ -101,14 +125,7 @@ class AzureOpenAIModel(BaseLLMModel, Logger):
                 ],
                 temperature=temperature,
                 max_tokens=16384,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": response_model.__name__,
-                        "schema": json_schema,
-                        "strict": False,
-                    },
-                },
+                response_format=json_schema_response_format(response_model),
             )
 
             finish_reason = response.choices[0].finish_reason
@@ -159,7 +176,7 @@ class AzureOpenAIModel(BaseLLMModel, Logger):
             kwargs["tool_choice"] = tool_choice
 
         try:
-            return self.client.chat.completions.create(**kwargs)
+            return await asyncio.to_thread(self.client.chat.completions.create, **kwargs)
         except (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError):
             raise
         except Exception as e:
@@ -1,20 +1,80 @@
+import logging
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 import pystache
+from pystache.parsed import ParsedTemplate
+
+logger = logging.getLogger(__name__)
 
 PROMPTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
-_renderer = pystache.Renderer(escape=lambda u: u)
+# Shared renderer: HTML escaping is disabled because prompts are sent to the LLM,
+# and missing tags render as empty strings so callers never pre-fill defaults.
+_renderer = pystache.Renderer(escape=lambda u: u, missing_tags="ignore")
 
+# Upper bound on document text spliced into a single prompt (roughly 100k tokens).
+# Longer input is cut here instead of being copied through rendering and the
+# request body only to be rejected by the model's context window.
+MAX_DOCUMENT_CHARS = 400_000
+
+
+@lru_cache(maxsize=64)
+def _parse_template(template: str) -> ParsedTemplate:
+    """Parse a template once; pystache re-parses plain strings on every render."""
+
+    return pystache.parse(template)
+
+
+def render_prompt(template: str, context: Dict[str, Any]) -> str:
+    """Render a Mustache template string with the shared renderer."""
+
+    return _renderer.render(_parse_template(template), context)
+
+
+@lru_cache(maxsize=None)
+def get_prompt_template(template_name: str) -> str:
+    """Read a template from disk on first use and keep it for the process lifetime.
+
+    Trailing spaces on each line and blank lines around the template are dropped
+    once here, so they are never sent (or billed) as prompt tokens.
+    """
 
-def load_prompt(template_name: str, context: Optional[dict] = None) -> str:
     template_path = os.path.join(PROMPTS_DIR, f"{template_name}.mustache")
 
     with open(template_path, "r", encoding="utf-8") as f:
-        template = f.read()
+        return "\n".join(line.rstrip() for line in f.read().splitlines()).strip()
+
+
+def load_prompt(template_name: str, context: Optional[dict] = None) -> str:
+    template = get_prompt_template(template_name)
 
     if context:
-        return _renderer.render(template, context)
+        return render_prompt(template, context)
 
     return template
+
+
+def truncate_document(text: str, max_chars: int = MAX_DOCUMENT_CHARS) -> str:
+    """Cut document text to ``max_chars`` before it is placed in a prompt.
+
+    The cut falls on the last paragraph break that fits (falling back to a line
+    break, then a space), and a marker is appended so the model reports on the
+    text as partial instead of treating later clauses as missing.
+    """
+
+    if len(text) <= max_chars:
+        return text
+
+    cut = -1
+    for boundary in ("\n\n", "\n", " "):
+        cut = text.rfind(boundary, 0, max_chars + len(boundary))
+        if cut > 0:
+            break
+    if cut <= 0:
+        cut = max_chars
+
+    kept = text[:cut].rstrip()
+    logger.warning("Document is %d chars — truncating to %d for the prompt.", len(text), len(kept))
+    return f"{kept}\n\n[Document truncated: {len(kept)} of {len(text)} characters shown]"
@@ -2,9 +2,8 @@ import json
 import re
 import time
 import uuid
-from datetime import datetime
-from pathlib import Path
-from typing import Any, List, Optional
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Tuple
 
 from docx.document import Document
 
@@ -16,6 +15,7 @@ from src.exceptions.parser_exceptions import (
 )
 from src.schemas.playbook_review import Clause
 from src.schemas.registry import Chunk, ParseResult
+from src.services.prompts.v1 import get_prompt_template
 from src.services.registry.base_parser import BaseParser
 from src.services.session_manager import SessionData
 
@@ -52,7 +52,7 @@ class AIParser(BaseParser, Logger):
 
         return text
 
-    async def clean_document(self, document: Document) -> None:
+    def clean_document(self, document: Document) -> None:
         """Clean the document by removing trailing spaces and extra chars."""
 
         try:
@@ -62,7 +62,7 @@ class AIParser(BaseParser, Logger):
         except Exception as e:
             raise DocxCleaningException(str(e)) from e
 
-    async def _extract_text(self, document: Document) -> str:
+    def _extract_text(self, document: Document) -> str:
         """Extract all text from the document — every paragraph, nothing skipped."""
 
         try:
@@ -82,6 +82,36 @@ class AIParser(BaseParser, Logger):
         except Exception as e:
             raise DocxParagraphExtractionException(str(e)) from e
 
+    def _request_clauses(self, text: str) -> Tuple[List[Clause], Optional[str]]:
+        """Send one clause-extraction request for ``text`` and parse the clause list.
+
+        Shared by the single-pass and two-pass paths; returns the clauses with the
+        completion's finish_reason so callers can tell a truncated answer apart.
+        """
+
+        prompt = get_prompt_template("ai_parser_prompt").replace("{{text}}", text)
+
+        response = self.llm_model.client.chat.completions.create(
+            model=self.llm_model.deployment_name,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=15000,
+            temperature=0,
+            response_format={"type": "json_object"},
+        )
+
+        finish_reason = response.choices[0].finish_reason
+        self.logger.info(f"finish_reason={finish_reason} | " f"prompt_tokens={response.usage.prompt_tokens} | " f"completion_tokens={response.usage.completion_tokens}")
+
+        if finish_reason == "length":
+            self.logger.error("Output was TRUNCATED by token limit! " "Increase max_tokens or split the document.")
+
+        raw_content = response.choices[0].message.content
+        clean_content = re.sub(r"^```(?:json)?\s*", "", raw_content.strip())
+        clean_content = re.sub(r"\s*```$", "", clean_content)
+
+        data = json.loads(clean_content)
+        return [Clause(**c) for c in data.get("clauses", [])], finish_reason
+
     async def _extract_clauses(self, text: str) -> List[Clause]:
         """Use the LLM to extract clauses from the document text."""
 
@@ -91,37 +121,8 @@ class AIParser(BaseParser, Logger):
             self.logger.warning("Empty text — returning no clauses")
             return []
 
-        # prompt = self._build_prompt(text)
-        prompt = Path(r"src\services\prompts\v1\ai_parser_prompt.mustache").read_text(encoding="utf-8")
-        prompt = prompt.replace("{{text}}", text)
-
         try:
-            client = self.llm_model.client
-            deployment = self.llm_model.deployment_name
-
-            response = client.chat.completions.create(
-                model=deployment,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=15000,
-                temperature=0,
-                response_format={"type": "json_object"},
-            )
-
-            finish_reason = response.choices[0].finish_reason
-            completion_tokens = response.usage.completion_tokens
-            prompt_tokens = response.usage.prompt_tokens
-            self.logger.info(f"finish_reason={finish_reason} | " f"prompt_tokens={prompt_tokens} | " f"completion_tokens={completion_tokens}")
-
-            if finish_reason == "length":
-                self.logger.error("Output was TRUNCATED by token limit! " "Increase max_tokens or split the document.")
-
-            raw_content = response.choices[0].message.content
-
-            clean_content = re.sub(r"^```(?:json)?\s*", "", raw_content.strip())
-            clean_content = re.sub(r"\s*```$", "", clean_content)
-
-            data = json.loads(clean_content)
-            clauses = [Clause(**c) for c in data.get("clauses", [])]
+            clauses, finish_reason = self._request_clauses(text)
 
             self.logger.info(f"Clauses extracted: {len(clauses)}")
             # if clauses:
@@ -175,28 +176,8 @@ class AIParser(BaseParser, Logger):
         if not text.strip():
             return []
         try:
-            client = self.llm_model.client
-            deployment = self.llm_model.deployment_name
-            # prompt = self._build_prompt(text)
-            prompt = Path(r"src\services\prompts\v1\ai_parser_prompt.mustache").read_text(encoding="utf-8")
-            prompt = prompt.replace("{{text}}", text)
-
-            response = client.chat.completions.create(
-                model=deployment,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=15000,
-                temperature=0,
-                response_format={"type": "json_object"},
-            )
-
-            finish_reason = response.choices[0].finish_reason
-            self.logger.info(f"finish_reason={finish_reason} | " f"completion_tokens={response.usage.completion_tokens}")
-
-            raw_content = response.choices[0].message.content
-            clean_content = re.sub(r"^```(?:json)?\s*", "", raw_content.strip())
-            clean_content = re.sub(r"\s*```$", "", clean_content)
-            data = json.loads(clean_content)
-            return [Clause(**c) for c in data.get("clauses", [])]
+            clauses, _ = self._request_clauses(text)
+            return clauses
 
         except Exception as e:
             self.logger.error(f"Failed: {e}")
@@ -211,10 +192,13 @@ class AIParser(BaseParser, Logger):
         """Parse the document using AI to extract clauses and chunk them."""
 
         start = time.time()
+        # One creation timestamp shared by every chunk from this parse
+        created_at = datetime.now(timezone.utc).isoformat()
 
         try:
-            await self.clean_document(document)
-            text = await self._extract_text(document)
+            # Whitespace is normalized by _clean_text as each paragraph is read, so the
+            # document is not rewritten through clean_document first.
+            text = self._extract_text(document)
 
             self.logger.info(f"Extracted text length: {len(text)}")
 
@@ -237,12 +221,13 @@ class AIParser(BaseParser, Logger):
             chunks: List[Chunk] = []
             document_id = str(uuid.uuid4())
 
-            for i, (clause, chunk_text) in enumerate(zip(clauses, chunks_text)):
-                vector = await self.embedding_service.generate_embeddings(text=chunk_text, task="text-matching")
-                await vector_store.index_embedding(vector)
+            # Embed every clause chunk in one batch and index the vectors with one add
+            vectors = await self.embedding_service.generate_embeddings_batch(texts=list(chunks_text), task="text-matching")
+            await vector_store.index_embeddings_batch(vectors)
 
+            for i, (clause, chunk_text) in enumerate(zip(clauses, chunks_text)):
                 chunk = Chunk(
-                    chunk_id=str(uuid.uuid4()),
+                    chunk_id=uuid.uuid4().hex,
                     document_id=document_id,
                     chunk_index=i,
                     content=chunk_text,
@@ -252,7 +237,7 @@ class AIParser(BaseParser, Logger):
                         "chunk_type": "ai_clause_chunk",
                         "section_heading": clause.title,
                     },
-                    created_at=datetime.utcnow().isoformat(),
+                    created_at=created_at,
                 )
                 chunks.append(chunk)
 
@@ -22,7 +22,7 @@ class BaseParser(ABC, Logger):
         pass
 
     @abstractmethod
-    async def clean_document(self, document: Document) -> None:
+    def clean_document(self, document: Document) -> None:
         """Clean the document before parsing."""
         pass
 
@@ -1272,14 +1272,19 @@ Unlike fixed-size chunking, this parser:
   - Preserves clause numbering prefixes for cross-referencing
 """
 
+import asyncio
 import re
 import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from docx.document import Document
+from docx.oxml.table import CT_Tbl
+from docx.oxml.text.paragraph import CT_P
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 from numpy import dot
 from numpy.linalg import norm
 
@@ -1301,6 +1306,14 @@ from src.services.vector_store.embeddings.base_embedding_service import (
 )
 from src.services.vector_store.manager import get_faiss_vector_store
 
+# ASCII control bytes (carriage return included) other than tab and newline.
+# Deleted with bytes.translate, which stays a single C loop on non-ASCII text
+# where a dict-based str.translate falls back to a per-character lookup.
+_CONTROL_BYTES = bytes(b for b in range(0x20) if b not in (0x09, 0x0A)) + b"\x7f"
+
+# Regex: any whitespace run, collapsed to a single space
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # Regex: numbered section labels or ALL-CAPS titles
 _SECTION_LABEL_RE = re.compile(r"^(" r"\d+[\.\)]?\s+\S.*|" r"\d+[\.\)]?\s*$|" r"[A-Z][A-Z\s\.\,\&\'\-]{1,60}$" r")")
 
@@ -1357,6 +1370,28 @@ _SINGLE_WORD_HEADING_BLACKLIST = frozenset(
 )
 
 
+def _iter_block_items(document: Document) -> Iterator[Union[Paragraph, Table]]:
+    """Yield the body's top-level paragraphs and tables in document order, in one pass."""
+    for child in document.element.body.iterchildren():
+        if isinstance(child, CT_P):
+            yield Paragraph(child, document)
+        elif isinstance(child, CT_Tbl):
+            yield Table(child, document)
+
+
+def _paragraph_style_key(paragraph: Paragraph) -> Optional[str]:
+    """Cache key for a paragraph's style, read without resolving the style when possible.
+
+    python-docx exposes the referenced style id only on its oxml element
+    (``paragraph._p.style``); if that is unavailable, the resolved style name is used.
+    """
+    element = getattr(paragraph, "_p", None)
+    if element is not None and hasattr(element, "style"):
+        return element.style
+    style = paragraph.style
+    return style.name if style is not None else None
+
+
 def _find_clause_heading_matches(text: str) -> List[Dict[str, Any]]:
     """Return clause-heading matches in paragraph order, deduped by start position.
 
@@ -1442,15 +1477,12 @@ class DocxParser(BaseParser, Logger):
         if not text or not text.strip():
             raise EmptyTextException("Text cannot be empty.")
 
-        # Replace special whitespace chars
-        text = text.replace("\u00a0", " ")
-        text = text.replace("\u200b", "")
-        text = text.replace("\ufeff", "")
-        text = text.replace("\r", "")
-        text = re.sub(r"[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]", "", text)
+        # Drop control chars and replace special whitespace chars
+        text = text.encode("utf-8", "ignore").translate(None, _CONTROL_BYTES).decode("utf-8")
+        text = text.replace("\u00a0", " ").replace("\u200b", "").replace("\ufeff", "")
 
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
 
         # Strip leading dots but preserve clause prefixes (e.g. "1.", "(a)")
         stripped = text.lstrip(" \n\t")
@@ -1461,7 +1493,7 @@ class DocxParser(BaseParser, Logger):
 
         return text
 
-    async def clean_document(self, document: Document) -> None:
+    def clean_document(self, document: Document) -> None:
         """Normalize whitespace in all paragraphs."""
         try:
             for paragraph in document.paragraphs:
@@ -1470,13 +1502,11 @@ class DocxParser(BaseParser, Logger):
         except Exception as e:
             raise DocxCleaningException(str(e)) from e
 
-    async def _extract_metadata(self, document: Document) -> Dict[str, Any]:
-        """Extract document metadata (author, title, dates, word count)."""
+    def _extract_metadata(self, document: Document, paragraph_count: int, table_count: int, word_count: int) -> Dict[str, Any]:
+        """Extract document metadata (author, title, dates); counts come from the extraction pass."""
         try:
             self.logger.info("Extracting document metadata")
             props = document.core_properties
-            para_words = sum(len(p.text.split()) for p in document.paragraphs)
-            table_words = sum(len(cell.text.split()) for table in document.tables for row in table.rows for cell in row.cells)
 
             return {
                 "source": "docx",
@@ -1484,38 +1514,78 @@ class DocxParser(BaseParser, Logger):
                 "title": props.title or "Untitled",
                 "created_at": props.created.isoformat() if props.created else None,
                 "modified_at": props.modified.isoformat() if props.modified else None,
-                "paragraph_count": len(document.paragraphs),
-                "table_count": len(document.tables),
-                "word_count": para_words + table_words,
+                "paragraph_count": paragraph_count,
+                "table_count": table_count,
+                "word_count": word_count,
             }
         except Exception as e:
             raise DocxMetadataExtractionException(str(e)) from e
 
-    async def _extract_tables(self, document: Document) -> List[Dict[str, Any]]:
-        """Extract all tables as lists of row data."""
+    def _extract_tables(self, tables: List[Table]) -> Tuple[List[Dict[str, Any]], int]:
+        """Extract all tables as lists of row data, with their total word count."""
         try:
-            tables = []
-            for t_idx, table in enumerate(document.tables):
-                rows = [[self._clean_text(cell.text) for cell in row.cells] for row in table.rows]
-                tables.append({"table_index": t_idx, "content": rows})
-            return tables
+            data = []
+            word_count = 0
+            for t_idx, table in enumerate(tables):
+                rows = []
+                for row in table.rows:
+                    cells = []
+                    for cell in row.cells:
+                        text = cell.text
+                        word_count += len(text.split())
+                        cells.append(self._clean_text(text))
+                    rows.append(cells)
+                data.append({"table_index": t_idx, "content": rows})
+            return data, word_count
         except Exception as e:
             raise DocxTableExtractionException(str(e)) from e
 
-    async def _extract_paragraphs(self, document: Document) -> List[Dict[str, Any]]:
-        """Extract paragraphs with heading detection (styled + structural heuristic)."""
+    def _extract_paragraphs(self, paragraphs: List[Paragraph]) -> Tuple[List[Dict[str, Any]], int]:
+        """Extract paragraphs with heading detection (styled + structural heuristic), with their total word count."""
         try:
             data = []
-            for idx, p in enumerate(document.paragraphs):
-                if p.text.strip():
-                    cleaned = self._clean_text(p.text)
+            word_count = 0
+            # Resolving p.style walks the styles part for every paragraph; a document
+            # only uses a handful of styles, so resolve each one once.
+            styled_heading: Dict[Optional[str], bool] = {}
+            for idx, p in enumerate(paragraphs):
+                text = p.text
+                word_count += len(text.split())
+                if text.strip():
+                    cleaned = self._clean_text(text)
                     if cleaned:
-                        is_heading = bool((p.style and p.style.name.startswith("Heading")) or self._is_structural_heading(cleaned, self._HEADING_MAX_WORDS))
+                        style_key = _paragraph_style_key(p)
+                        if style_key not in styled_heading:
+                            styled_heading[style_key] = bool(p.style and p.style.name.startswith("Heading"))
+                        is_heading = styled_heading[style_key] or self._is_structural_heading(cleaned, self._HEADING_MAX_WORDS)
                         data.append({"index": idx, "content": cleaned, "is_heading": is_heading})
-            return data
+            return data, word_count
         except Exception as e:
             raise DocxParagraphExtractionException(str(e)) from e
 
+    def _extract_all(self, document: Document) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract metadata, paragraphs and tables in one call.
+
+        Paragraphs and tables are collected in a single walk over the body XML
+        (document.paragraphs and document.tables would each walk it again), and
+        word counts are taken during extraction instead of in a separate metadata walk.
+        The document is not run through clean_document: rewriting paragraph.text
+        rebuilds every run in the XML, and _clean_text already normalizes
+        whitespace as each paragraph and cell is read.
+        """
+        paragraphs: List[Paragraph] = []
+        tables: List[Table] = []
+        for block in _iter_block_items(document):
+            if isinstance(block, Paragraph):
+                paragraphs.append(block)
+            else:
+                tables.append(block)
+
+        paragraph_data, paragraph_words = self._extract_paragraphs(paragraphs)
+        table_data, table_words = self._extract_tables(tables)
+        metadata = self._extract_metadata(document, paragraph_count=len(paragraphs), table_count=len(tables), word_count=paragraph_words + table_words)
+        return metadata, paragraph_data, table_data
+
     @staticmethod
     def _split_at_clause_boundaries(paragraphs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Split paragraphs at every inline clause heading.
@@ -1596,7 +1666,7 @@ class DocxParser(BaseParser, Logger):
         paragraphs = self._split_at_clause_boundaries(paragraphs)
 
         texts = [para["content"] for para in paragraphs]
-        embeddings = [await self.embedding_service.generate_embeddings(text=t, task="text-matching") for t in texts]
+        embeddings = await self.embedding_service.generate_embeddings_batch(texts=texts, task="text-matching")
 
         # Compute pairwise similarities between consecutive paragraphs
         similarities = [self.cosine_similarity(embeddings[i], embeddings[i + 1]) for i in range(len(embeddings) - 1)]
@@ -1676,30 +1746,33 @@ class DocxParser(BaseParser, Logger):
     async def parse_data(self, data: List[TextInfo], session_data: Optional[Any] = None) -> ParseResult:
         """Parse structured text data (list of paragraphs)."""
         start = time.time()
+        # One creation timestamp shared by every chunk from this parse
+        created_at = datetime.now(timezone.utc).isoformat()
 
         paragraphs = [d.text for d in data]
         if not paragraphs:
             raise ValueError("No paragraphs found in the data.")
 
-        # Embed and index each paragraph
-        for para in paragraphs:
-            if not para:
-                continue
-            vector = await self.embedding_service.generate_embeddings(text=para, task="text-matching")
-            await self.vector_store.index_embedding(vector)
+        # Embed all non-empty paragraphs in one batch and index them with one add.
+        # Chunks are created for the same paragraphs, so vector positions line up
+        # with the chunk store once the chunks are indexed.
+        kept = [(i, text) for i, text in enumerate(paragraphs) if text and text.strip()]
+        vector_store = session_data.vector_store if session_data else self.vector_store
+        vectors = await self.embedding_service.generate_embeddings_batch(texts=[text for _, text in kept], task="text-matching")
+        await vector_store.index_embeddings_batch(vectors)
 
         chunks: List[Chunk] = []
-        for i, text in enumerate(paragraphs):
+        for i, text in kept:
             chunks.append(
                 Chunk(
-                    chunk_id=str(uuid.uuid4()),
+                    chunk_id=uuid.uuid4().hex,
                     document_id=None,
                     chunk_index=i,
                     content=text,
                     embedding_model=self.embedding_service.model_name,
                     embedding_vector=None,
                     metadata={"chunk_type": "semantic_paragraph"},
-                    created_at=datetime.utcnow().isoformat(),
+                    created_at=created_at,
                 )
             )
 
@@ -1713,77 +1786,75 @@ class DocxParser(BaseParser, Logger):
     async def parse_document(self, document: Document, session_data: Optional["SessionData"] = None) -> ParseResult:
         """Parse a DOCX document using semantic chunking."""
         start = time.time()
+        # One creation timestamp shared by every chunk from this parse
+        created_at = datetime.now(timezone.utc).isoformat()
 
         try:
-            await self.clean_document(document)
-            metadata = await self._extract_metadata(document)
+            # python-docx traversal is pure CPU work; one thread hop keeps it off the event loop.
+            metadata, paragraphs, tables = await asyncio.to_thread(self._extract_all, document)
 
             document_id = str(uuid.uuid4())
             metadata["document_id"] = document_id
 
-            paragraphs = await self._extract_paragraphs(document)
-            tables = await self._extract_tables(document)
-
             vector_store = session_data.vector_store if session_data else self.vector_store
             semantic_chunks = await self._semantic_chunk_paragraphs(paragraphs)
 
-            chunks: List[Chunk] = []
-            chunk_index = 0
+            # Collect (content, metadata, embedding task) for every chunk first so they
+            # are embedded in batched calls instead of one call per chunk.
+            pending: List[Tuple[str, Dict[str, Any], Optional[str]]] = []
+
+            # Paragraphs and table cells were cleaned during extraction, so the
+            # chunk and table texts built from them are used as-is.
 
             # Text chunks
             for chunk_info in semantic_chunks:
-                cleaned = self._clean_text(chunk_info["text"])
-                if not cleaned:
+                cleaned = chunk_info["text"]
+                if not cleaned.strip():
                     continue
 
-                vector = await self.embedding_service.generate_embeddings(text=cleaned, task="text-matching")
-                await vector_store.index_embedding(vector)
-
                 chunk_metadata: Dict[str, Any] = {"chunk_type": "semantic_paragraph"}
                 if chunk_info.get("section_heading"):
                     chunk_metadata["section_heading"] = chunk_info["section_heading"]
-
-                chunks.append(
-                    Chunk(
-                        chunk_id=str(uuid.uuid4()),
-                        document_id=document_id,
-                        chunk_index=chunk_index,
-                        content=cleaned,
-                        embedding_model=self.embedding_service.model_name,
-                        embedding_vector=None,
-                        metadata=chunk_metadata,
-                        created_at=datetime.utcnow().isoformat(),
-                    )
-                )
-                chunk_index += 1
+                pending.append((cleaned, chunk_metadata, "text-matching"))
 
             # Table chunks
             for table in tables:
-                rows = [" | ".join(r) for r in table["content"]]
-                table_text = self._clean_text(" ".join(rows))
-                if not table_text:
+                table_text = " ".join(" | ".join(row) for row in table["content"])
+                if not table_text.strip():
                     continue
 
-                vector = await self.embedding_service.generate_embeddings(text=table_text)
-                await vector_store.index_embedding(vector)
+                table_metadata: Dict[str, Any] = {
+                    "chunk_type": "table",
+                    "table_index": table["table_index"],
+                    "row_count": len(table["content"]),
+                }
+                # Tables use the embedding service's default task
+                pending.append((table_text, table_metadata, None))
+
+            # One batch per embedding task, with vectors put back in chunk order so
+            # vector store positions line up with chunk_index, then a single add
+            vectors: List[List[float]] = [[] for _ in pending]
+            for task in dict.fromkeys(chunk_task for _, _, chunk_task in pending):
+                positions = [i for i, (_, _, chunk_task) in enumerate(pending) if chunk_task == task]
+                batch = await self.embedding_service.generate_embeddings_batch(texts=[pending[i][0] for i in positions], task=task)
+                for i, vector in zip(positions, batch):
+                    vectors[i] = vector
+            await vector_store.index_embeddings_batch(vectors)
 
+            chunks: List[Chunk] = []
+            for chunk_index, (content, chunk_metadata, _) in enumerate(pending):
                 chunks.append(
                     Chunk(
-                        chunk_id=str(uuid.uuid4()),
+                        chunk_id=uuid.uuid4().hex,
                         document_id=document_id,
                         chunk_index=chunk_index,
-                        content=table_text,
+                        content=content,
                         embedding_model=self.embedding_service.model_name,
                         embedding_vector=None,
-                        metadata={
-                            "chunk_type": "table",
-                            "table_index": table["table_index"],
-                            "row_count": len(table["content"]),
-                        },
-                        created_at=datetime.utcnow().isoformat(),
+                        metadata=chunk_metadata,
+                        created_at=created_at,
                     )
                 )
-                chunk_index += 1
 
             # NOTE: chunk_store indexing is handled by IngestionService._parse_data()
 
@@ -1,10 +1,10 @@
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.config.logging import Logger
 from src.config.settings import get_settings
 from src.schemas.doc_chat import QueryRewriterResponse
 from src.services.llm.base_model import BaseLLMModel
+from src.services.prompts.v1 import get_prompt_template
 from src.services.session_manager import SessionData
 from src.services.vector_store.embeddings.base_embedding_service import (
     BaseEmbeddingService,
@@ -28,7 +28,7 @@ class RetrievalService(Logger):
         service_container = get_service_container()
         self.embedding_service: BaseEmbeddingService = service_container.embedding_service
         self.llm: BaseLLMModel = service_container.azure_openai_model
-        self.rewrite_query_prompt = Path(r"src\services\prompts\v1\query_rewriter.mustache").read_text()
+        self.rewrite_query_prompt = get_prompt_template("query_rewriter")
         self.vector_store = get_faiss_vector_store(self.embedding_service.get_embedding_dimensions())
 
     async def rewrite_query(self, query: str) -> List[str]:
@@ -1,5 +1,4 @@
 import asyncio
-from pathlib import Path
 from typing import Any, Dict, List
 
 import numpy as np
@@ -13,6 +12,7 @@ from src.schemas.playbook_review import (
     RuleResult,
     TextInfo,
 )
+from src.services.prompts.v1 import get_prompt_template
 
 logger = get_logger(__name__)
 
@@ -23,7 +23,7 @@ async def get_missing_clauses(data: str) -> List[str]:
     service_container = get_service_container()
     llm_model = service_container.azure_openai_model
 
-    prompt = Path(r"src\services\prompts\v1\missing_clauses.mustache").read_text(encoding="utf-8")
+    prompt = get_prompt_template("missing_clauses")
     context = {"data": data}
     response = await llm_model.generate(
         prompt=prompt,
@@ -14,3 +14,12 @@ class BaseEmbeddingService(ABC):
     async def generate_embeddings(self, text: str, task: Optional[str]) -> List[float]:
         """Generate embeddings for the given text."""
         pass
+
+    async def generate_embeddings_batch(self, texts: List[str], task: Optional[str] = None) -> List[List[float]]:
+        """Generate embeddings for several texts; services that can batch should override this.
+
+        A task of None leaves each service's own default task in place.
+        """
+        if task is None:
+            return [await self.generate_embeddings(text=text) for text in texts]  # type: ignore[call-arg]
+        return [await self.generate_embeddings(text=text, task=task) for text in texts]
@@ -1,11 +1,15 @@
+import asyncio
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from google import genai
 
 from src.config.logging import Logger
 from src.config.settings import get_settings
 
+# Gemini accepts at most 100 texts in one embed_content request.
+_MAX_BATCH_SIZE = 100
+
 
 class GeminiEmbeddingService(Logger):
     """Google Gemini embedding service."""
@@ -64,6 +68,53 @@ class GeminiEmbeddingService(Logger):
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
+    async def generate_embeddings_batch(self, texts: List[str], task: Optional[str] = None) -> List[List[float]]:
+        """Generate embeddings for many texts, up to _MAX_BATCH_SIZE texts per request.
+
+        Requests for long documents run concurrently, at most
+        settings.embedding_concurrency at a time; results keep input order.
+        """
+        if not texts:
+            return []
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("Text can't be empty.")
+
+        try:
+            start_time = time.time()
+
+            semaphore = asyncio.Semaphore(self.settings.embedding_concurrency)
+
+            async def _embed(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    vector_data = await self.client.aio.models.embed_content(
+                        model=self.model_name,
+                        contents=batch,
+                    )
+                self.stats["api_calls"] += 1
+                return [embedding.values for embedding in vector_data.embeddings]
+
+            results = await asyncio.gather(*(_embed(texts[i : i + _MAX_BATCH_SIZE]) for i in range(0, len(texts), _MAX_BATCH_SIZE)))
+            embeddings: List[List[float]] = [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+            generation_time = time.time() - start_time
+
+            # Update stats; the running average is per embedding, so the batch time
+            # counts as len(texts) embeddings of generation_time / len(texts) each
+            previous_count = self.stats["embedding_generated"]
+            self.stats["embedding_generated"] += len(texts)
+            self.stats["total_tokens_processed"] += sum(len(text.split()) for text in texts)
+            self.stats["average_embedding_time"] = (self.stats["average_embedding_time"] * previous_count + generation_time) / self.stats["embedding_generated"]
+
+            self.logger.debug(f"Generated {len(texts)} Embeddings in {generation_time:.2f}s")
+
+            return embeddings
+
+        except Exception as e:
+            self.stats["errors"] += 1
+            error_msg = f"Failed to generate embeddings: {str(e)}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
     async def get_stats(self) -> Dict[str, Any]:
         """Return embedding services statistics."""
 
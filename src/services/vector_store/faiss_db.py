@@ -61,6 +61,29 @@ class FAISSVectorStore(BaseVectorStore, Logger):
         except Exception as e:
             raise FAISSUnableToIndexException("Unable to index embeddings into database.") from e
 
+    async def index_embeddings_batch(self, embeddings: List[List[float]]) -> None:
+        """Add many embedding vectors to the FAISS index in a single add call."""
+        if not embeddings:
+            return
+        if any(not embedding for embedding in embeddings):
+            raise FAISSEmptyEmbeddingException("Cannot index an empty embedding vector.")
+
+        try:
+            vectors = np.array(embeddings, dtype=np.float32)
+
+            start_time = time.time()
+            vectors = self._validate_vectors(vectors)
+            self.index.add(vectors)
+            elapsed_time = time.time() - start_time
+
+            # Update stats
+            self.stats["vectors_added"] += vectors.shape[0]
+            self.stats["total_add_time"] += elapsed_time
+
+            self.logger.info(f"Added {vectors.shape[0]} vectors in {elapsed_time:.4f}s")
+        except Exception as e:
+            raise FAISSUnableToIndexException("Unable to index embeddings into database.") from e
+
     async def search_index(self, query_embedding: List[float], top_k: int = 5) -> Dict[str, Any]:
         """Perform cosine similarity and return the top-k indices."""
 
@@ -1,6 +1,5 @@
 import asyncio
 import re
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -18,6 +17,7 @@ from src.schemas.comparision import (
     SectionGroup,
 )
 from src.schemas.registry import ParseResult
+from src.services.prompts.v1 import get_prompt_template
 from src.services.registry.registry import ParserRegistry
 
 AGENT_NAME = "document_comparison_agent"
@@ -550,7 +550,7 @@ def _reconcile_matched_containment(pairs: List[Tuple[int, int, float]], clauses_
 async def _compare_single_pair(clause_a: ClauseUnit, clause_b: ClauseUnit, llm_client) -> ClauseComparisonLLMResponse:
     """Send one clause pair to the LLM for detailed comparison."""
 
-    prompt = Path(r"src\services\prompts\v1\clause_comparison_prompt.mustache").read_text()
+    prompt = get_prompt_template("clause_comparison_prompt")
 
     context = {
         "clause_heading": clause_a.heading or clause_b.heading or "Unnamed Clause",
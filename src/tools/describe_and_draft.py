@@ -48,7 +48,6 @@
 #     return generated_content
 
 
-from pathlib import Path
 from typing import Optional
 
 from src.dependencies import get_service_container
@@ -58,6 +57,7 @@ from src.schemas.describe_and_draft import (
     NDAGenerationHeadingRequest,
     NDAGenerationHeadingResponse,
 )
+from src.services.prompts.v1 import get_prompt_template
 
 AGENT_NAME = "describe_and_draft"
 
@@ -79,7 +79,7 @@ async def generate_nda_headings(request: NDAGenerationHeadingRequest, session_id
         return NDAGenerationHeadingResponse(headings=list(agent_results.keys()))
 
     # Load prompt
-    prompt = Path(r"src\services\prompts\v1\nda_generation.mustache").read_text(encoding="utf-8")
+    prompt = get_prompt_template("nda_generation")
 
     context = {
         "nda_description": request.nda_description,
@@ -125,7 +125,7 @@ async def generate_heading_description(request: NDAContentGenerationRequest, ses
         return agent_results[heading]["content"]
 
     # Load prompt
-    prompt = Path(r"src\services\prompts\v1\nda_description_prompt.mustache").read_text(encoding="utf-8")
+    prompt = get_prompt_template("nda_description_prompt")
 
     context = {
         "nda_description": agent_results["user_input"],
@@ -127,6 +127,9 @@ _MIN_SUMMARY_LEN = 80
 # chars catches truly empty labels ("LoL clause") without rejecting useful
 # one-liners ("Limits each party's liability for indirect damages.").
 _MIN_LIST_SUMMARY_LEN = 40
+# Prompt-context fallback shared by the single-clause and list generators when
+# the attached document does not name a governing law.
+_UNSPECIFIED_GOVERNING_LAW = "(not specified in document)"
 
 # Prescribed legal angles cycled through on each successive regenerate of the same
 # clause, so the LLM produces visibly different drafts instead of the same shape
@@ -602,6 +605,30 @@ def _format_relevant_chunks(chunks: List[Dict[str, Any]], limit: int = 3) -> str
     return "\n\n---\n\n".join(pieces)
 
 
+def _base_generation_context(
+    prompt: str,
+    agreement_type: Optional[str],
+    prior_clauses: List[str],
+    doc_grounding: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Generation-prompt context shared by single-clause and list mode.
+
+    Built once per call; each mode layers only its own keys on top.
+    """
+    has_grounding = bool(doc_grounding and doc_grounding.get("parties"))
+    governing_law = (doc_grounding or {}).get("governing_law") or ""
+    return {
+        "user_prompt": prompt,
+        "agreement_type": agreement_type or "",
+        "has_agreement_type": bool(agreement_type),
+        "prior_clauses": "\n".join(prior_clauses) if prior_clauses else "",
+        "has_prior_clauses": bool(prior_clauses),
+        "has_doc_grounding": has_grounding,
+        "doc_parties_block": _format_parties_block(doc_grounding["parties"]) if has_grounding else "",
+        "doc_governing_law": governing_law or _UNSPECIFIED_GOVERNING_LAW,
+    }
+
+
 async def _generate_clause_draft(
     prompt: str,
     agreement_type: Optional[str],
@@ -626,30 +653,19 @@ async def _generate_clause_draft(
     llm = container.azure_openai_model
     mode_instruction = f"Draft a {agreement_type or 'legal'} clause as requested by the user."
     is_regenerate = prior_draft is not None
-    has_grounding = bool(doc_grounding and doc_grounding.get("parties"))
-    parties_block = _format_parties_block(doc_grounding["parties"]) if has_grounding else ""
-    governing_law = (doc_grounding or {}).get("governing_law") or ""
     chunks_text = _format_relevant_chunks(relevant_chunks or [])
 
     angle_text = (regenerate_angle or "").strip() if is_regenerate else ""
-    context = {
-        "user_prompt": prompt,
+    context = _base_generation_context(prompt, agreement_type, prior_clauses, doc_grounding) | {
         "mode": "single_clause",
         "mode_instruction": mode_instruction,
         "is_single_clause": True,
         "is_list_of_clauses": False,
-        "agreement_type": agreement_type or "",
-        "has_agreement_type": bool(agreement_type),
-        "prior_clauses": "\n".join(prior_clauses) if prior_clauses else "",
-        "has_prior_clauses": bool(prior_clauses),
         "is_regenerate": is_regenerate,
         "prior_draft_title": prior_draft.title if prior_draft else "",
         "prior_draft_clause": prior_draft.drafted_clause if prior_draft else "",
         "has_regenerate_angle": bool(angle_text),
         "regenerate_angle": angle_text,
-        "has_doc_grounding": has_grounding,
-        "doc_parties_block": parties_block,
-        "doc_governing_law": governing_law or "(not specified in document)",
         "has_relevant_chunks": bool(chunks_text),
         "doc_relevant_chunks": chunks_text,
     }
@@ -680,23 +696,12 @@ async def _generate_clause_list(
     container = get_service_container()
     llm = container.azure_openai_model
     mode_instruction = f"List all clauses that should appear in a " f"{agreement_type or 'legal agreement'} as requested by the user, " f"and draft the body of each one."
-    has_grounding = bool(doc_grounding and doc_grounding.get("parties"))
-    parties_block = _format_parties_block(doc_grounding["parties"]) if has_grounding else ""
-    governing_law = (doc_grounding or {}).get("governing_law") or ""
 
-    context = {
-        "user_prompt": prompt,
+    context = _base_generation_context(prompt, agreement_type, prior_clauses, doc_grounding) | {
         "mode": "list_of_clauses",
         "mode_instruction": mode_instruction,
         "is_single_clause": False,
         "is_list_of_clauses": True,
-        "agreement_type": agreement_type or "",
-        "has_agreement_type": bool(agreement_type),
-        "prior_clauses": "\n".join(prior_clauses) if prior_clauses else "",
-        "has_prior_clauses": bool(prior_clauses),
-        "has_doc_grounding": has_grounding,
-        "doc_parties_block": parties_block,
-        "doc_governing_law": governing_law or "(not specified in document)",
     }
     rendered = load_prompt("describe_draft_generation_prompt", context=context)
     return await llm.generate(
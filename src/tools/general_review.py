@@ -42,7 +42,6 @@ Two modes:
 import asyncio
 import json
 import logging
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -60,6 +59,8 @@ from src.services.clause_extractor import (
     extract_all_clauses,
     extract_clauses,
 )
+from src.services.llm.azure_openai_model import json_schema_response_format
+from src.services.prompts.v1 import get_prompt_template
 from src.services.session_manager import SessionData
 
 logger = logging.getLogger(__name__)
@@ -94,12 +95,11 @@ MATCH_SIMILARITY_THRESHOLD = 0.30
 # narrates what other clauses don't contain.
 MAX_MATCHED_CLAUSES = 3
 
-# --- Prompt paths ------------------------------------------------------------
+# --- Prompt templates --------------------------------------------------------
 
-_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "services" / "prompts" / "v1"
-_CLAUSE_REVIEW_PROMPT_PATH = _PROMPTS_DIR / "general_review_clause_prompt.mustache"
-_RELEVANCE_PROMPT_PATH = _PROMPTS_DIR / "general_review_relevance_check_prompt.mustache"
-_PROMPT_SPLITTER_PROMPT_PATH = _PROMPTS_DIR / "general_review_prompt_splitter_prompt.mustache"
+_CLAUSE_REVIEW_PROMPT = "general_review_clause_prompt"
+_RELEVANCE_PROMPT = "general_review_relevance_check_prompt"
+_PROMPT_SPLITTER_PROMPT = "general_review_prompt_splitter_prompt"
 
 _REVIEW_SYSTEM_MESSAGE = (
     "You are an expert Contract Review Analyst for Accorder AI. "
@@ -157,14 +157,7 @@ def _sync_generate_structured(
         ],
         temperature=0.0,
         max_tokens=16384,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "name": response_model.__name__,
-                "schema": response_model.model_json_schema(),
-                "strict": False,
-            },
-        },
+        response_format=json_schema_response_format(response_model),
     )
 
     response_text = response.choices[0].message.content
@@ -174,6 +167,28 @@ def _sync_generate_structured(
     return response_model.model_validate(json.loads(response_text))
 
 
+async def _generate_from_template(
+    prompt_name: str,
+    context: Dict[str, Any],
+    system_message: str,
+    response_model: Any,
+) -> Any:
+    """Render a named prompt template and run the structured call off the event loop.
+
+    Shared by the splitter, relevance-gate and per-clause review calls, which
+    differ only in template, context, system message and response model.
+    """
+    llm = get_service_container().azure_openai_model
+    rendered = llm.render_prompt_template(prompt=get_prompt_template(prompt_name), context=context)
+    return await asyncio.to_thread(
+        _sync_generate_structured,
+        llm,
+        system_message,
+        rendered,
+        response_model,
+    )
+
+
 async def _split_prompt_into_subtopics(user_prompt: str) -> List[str]:
     """Break a multi-topic user prompt into atomic sub-instructions.
 
@@ -194,19 +209,11 @@ async def _split_prompt_into_subtopics(user_prompt: str) -> List[str]:
       - If the splitter returns an empty list (schema violation), same
         fallback.
     """
-    container = get_service_container()
-    llm = container.azure_openai_model
-    template = _PROMPT_SPLITTER_PROMPT_PATH.read_text(encoding="utf-8")
-    rendered = llm.render_prompt_template(
-        prompt=template,
-        context={"user_prompt": user_prompt},
-    )
     try:
-        parsed: PromptSplitLLMResponse = await asyncio.to_thread(
-            _sync_generate_structured,
-            llm,
+        parsed: PromptSplitLLMResponse = await _generate_from_template(
+            _PROMPT_SPLITTER_PROMPT,
+            {"user_prompt": user_prompt},
             _SPLITTER_SYSTEM_MESSAGE,
-            rendered,
             PromptSplitLLMResponse,
         )
     except Exception as exc:
@@ -226,22 +233,14 @@ async def _run_relevance_check(
     user_prompt: str,
 ) -> RelevanceCheckLLMResponse:
     """Ask the gate LLM whether the user's query applies to the selected clause."""
-    container = get_service_container()
-    llm = container.azure_openai_model
-    template = _RELEVANCE_PROMPT_PATH.read_text(encoding="utf-8")
-    rendered = llm.render_prompt_template(
-        prompt=template,
-        context={
+    return await _generate_from_template(
+        _RELEVANCE_PROMPT,
+        {
             "clause_title": clause_title,
             "clause_text": clause_text,
             "user_prompt": user_prompt,
         },
-    )
-    return await asyncio.to_thread(
-        _sync_generate_structured,
-        llm,
         _RELEVANCE_SYSTEM_MESSAGE,
-        rendered,
         RelevanceCheckLLMResponse,
     )
 
@@ -258,22 +257,14 @@ async def _run_clause_review(
     dropped with a warning. This protects the apply button from ever being
     handed an un-anchored fix.
     """
-    container = get_service_container()
-    llm = container.azure_openai_model
-    template = _CLAUSE_REVIEW_PROMPT_PATH.read_text(encoding="utf-8")
-    rendered = llm.render_prompt_template(
-        prompt=template,
-        context={
+    parsed: ClauseSuggestionsLLMResponse = await _generate_from_template(
+        _CLAUSE_REVIEW_PROMPT,
+        {
             "clause_title": clause_title,
             "clause_text": clause_text,
             "user_prompt": user_prompt,
         },
-    )
-    parsed: ClauseSuggestionsLLMResponse = await asyncio.to_thread(
-        _sync_generate_structured,
-        llm,
         _REVIEW_SYSTEM_MESSAGE,
-        rendered,
         ClauseSuggestionsLLMResponse,
     )
 
@@ -1,16 +1,12 @@
-from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel
 
 from src.dependencies import get_service_container
 from src.schemas.contract_analyzer import ContractAnalyzerResponse
-from src.schemas.tool_schema import KeyInformationToolResponse
-from src.services.llm.azure_openai_model import AzureOpenAIModel
+from src.services.prompts.v1 import get_prompt_template, load_prompt, truncate_document
 from src.services.vector_store.manager import get_all_chunks
 
-_llm = AzureOpenAIModel()
-
 AGENT_NAME = "Contract Analyzer"
 
 
@@ -28,13 +24,12 @@ async def get_key_information_document(content: str, session_id: str) -> str:
     if agent_cache:
         return agent_cache
 
-    prompt_path = Path(r"src\services\prompts\v1\key_information_prompt.mustache").read_text(encoding="utf-8")
+    prompt_path = get_prompt_template("key_information_prompt")
 
     response: str = await llm_model.generate(
         prompt=prompt_path,
-        context={"contract_text": content},
+        context={"contract_text": truncate_document(content)},
         response_model=ContractAnalyzerResponse,
-        mode="JSON",
     )
 
     session_data.tool_results[AGENT_NAME] = response
@@ -71,14 +66,12 @@ async def get_key_information(session_id: Optional[str] = None, response_format:
 
     full_text = "\n\n".join(chunk.content for chunk in results.values() if getattr(chunk, "content", None))
 
-    prompt_path = Path(r"src\services\prompts\v1\key_information_prompt.mustache").read_text(encoding="utf-8")
+    prompt = load_prompt("key_information_prompt", {"contract_text": truncate_document(full_text)})
 
-    response: str | KeyInformationToolResponse = await _llm.generate(
-        prompt=prompt_path,
-        context={"contract_text": full_text},
-        response_model=None,
-        mode="markdown",
-    )
+    # Callers serve this response text as-is, so request free text rather than
+    # a JSON-schema structured response.
+    completion = await container.azure_openai_model.chat_completion(messages=[{"role": "user", "content": prompt}])
+    response: str = completion.choices[0].message.content or ""
 
     # Store the result in session if session exists
     if session:
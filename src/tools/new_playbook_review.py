@@ -11,6 +11,7 @@ from src.schemas.playbook_review import (
     PlayBookReviewResponse,
     RuleCheckRequest,
 )
+from src.services.prompts.v1 import get_prompt_template
 from src.services.session_manager import SessionData
 
 logger = get_logger(__name__)
@@ -89,9 +90,7 @@ async def validate_clause_against_rule(clause_content: str, rule_title: str, rul
     llm_model = container.azure_openai_model
 
     # Use the same prompt as the old playbook review
-    from pathlib import Path
-
-    prompt = Path(r"src\services\prompts\v1\ai_review_prompt_v2.mustache").read_text(encoding="utf-8")
+    prompt = get_prompt_template("ai_review_prompt_v2")
 
     context = {"rule_title": rule_title, "rule_instruction": rule_instruction, "rule_description": rule_description, "paragraphs": f"PARA_ID: clause_content\nTEXT: {clause_content}"}
 
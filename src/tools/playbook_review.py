@@ -1,7 +1,6 @@
 import asyncio
 import hashlib
 import re
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from src.config.logging import get_logger
@@ -17,15 +16,17 @@ from src.schemas.playbook_review import (
     TextInfo,
 )
 from src.services.llm.azure_openai_model import AzureOpenAIModel
+from src.services.prompts.v1 import get_prompt_template, truncate_document
 
 logger = get_logger(__name__)
 
 
 AGENT_NAME = "playbook_review_agent"
 
-SIMILARITY_PROMPT = Path(r"src\services\prompts\v1\ai_review_prompt_v2.mustache").read_text(encoding="utf-8")
+# Prompt templates are read lazily on first use (see get_prompt_template).
+SIMILARITY_PROMPT_NAME = "ai_review_prompt_v2"
 
-MISSING_CLAUSES_PROMPT = Path(r"src\services\prompts\v1\missing_clauses.mustache").read_text(encoding="utf-8")
+MISSING_CLAUSES_PROMPT_NAME = "missing_clauses"
 
 
 def _hash(text: str) -> str:
@@ -94,9 +95,9 @@ async def get_missing_clauses(llm_model: AzureOpenAIModel, full_text: str, revie
 
     try:
         response: MissingClausesLLMResponse = await llm_model.generate(
-            prompt=MISSING_CLAUSES_PROMPT,
+            prompt=get_prompt_template(MISSING_CLAUSES_PROMPT_NAME),
             context={
-                "data": full_text,
+                "data": truncate_document(full_text),
                 "reviewed_rules_summary": reviewed_rules_summary,
             },
             response_model=MissingClausesLLMResponse,
@@ -141,7 +142,7 @@ async def _process_rule(
 
     try:
         llm_response: PlayBookReviewLLMResponse = await llm_model.generate(
-            prompt=SIMILARITY_PROMPT,
+            prompt=get_prompt_template(SIMILARITY_PROMPT_NAME),
             context={
                 "rule_title": result.title,
                 "rule_instruction": result.instruction,
@@ -1,15 +1,11 @@
-from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel
 
 from src.dependencies import get_service_container
-from src.schemas.tool_schema import SummaryToolResponse
-from src.services.llm.azure_openai_model import AzureOpenAIModel
+from src.services.prompts.v1 import load_prompt, truncate_document
 from src.services.vector_store.manager import get_all_chunks
 
-llm_service = AzureOpenAIModel()
-
 
 async def get_summary(session_id: Optional[str], response: str = "JSON") -> str | BaseModel:
     """Summary tool for the orchestrator agent or API."""
@@ -37,10 +33,12 @@ async def get_summary(session_id: Optional[str], response: str = "JSON") -> str
 
     full_text = "\n\n".join((chunk.content for chunk in results.values() if getattr(chunk, "content", None)))
 
-    prompt_template = Path(r"src\services\prompts\v1\summary_prompt_template.mustache").read_text()
-    context = {"text": full_text}
+    prompt = load_prompt("summary_prompt_template", {"text": truncate_document(full_text)})
 
-    summary: str | SummaryToolResponse = await llm_service.generate(prompt=prompt_template, context=context, response_model=None, mode="markdown")
+    # The template asks for a markdown summary, which callers serve as-is, so
+    # request free text rather than a JSON-schema structured response.
+    completion = await container.azure_openai_model.chat_completion(messages=[{"role": "user", "content": prompt}])
+    summary: str = completion.choices[0].message.content or ""
 
     # Store the result in session if session exists
     if session:
@@ -1,8 +1,11 @@
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 from scipy.spatial.distance import cosine
 
+from src.services.vector_store.embeddings import embedding_service
 from src.services.vector_store.embeddings.embedding_service import (
     BGEEmbeddingService,
     HuggingFaceEmbeddingService,
@@ -13,13 +16,6 @@ from src.services.vector_store.embeddings.gemini_embeddings import (
 from src.services.vector_store.embeddings.openai_embeddings import OpenAIEmbeddings
 from src.services.vector_store.embeddings.qwen_embeddings import Qwen3EmbeddingService
 
-# Initialize services
-sentence_transformers = HuggingFaceEmbeddingService()
-bge_service = BGEEmbeddingService()
-gemini_service = GeminiEmbeddingService()
-openai_service = OpenAIEmbeddings()
-qwen_service = Qwen3EmbeddingService()
-
 
 async def generate_embeddings(text: str) -> Dict[str, Any]:
     """Generate embeddings for all services for comparison."""
@@ -66,7 +62,78 @@ async def compare_embeddings(texts: Dict[str, str]) -> None:
                 print(f"{t1:15} - {t2:15}: {sim:.4f}")
 
 
+def _fake_encode(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """Deterministic stand-in for SentenceTransformer.encode: one vector per text."""
+    return np.array([[float(len(text)), float(text.count("a"))] for text in texts])
+
+
+def _huggingface_service(cache_size: int) -> HuggingFaceEmbeddingService:
+    """HuggingFaceEmbeddingService with the model replaced by _fake_encode."""
+    with patch.object(embedding_service, "SentenceTransformer"):
+        service = HuggingFaceEmbeddingService()
+    service.tokenizer.encode = MagicMock(side_effect=_fake_encode)
+    service.settings = MagicMock(embedding_cache_size=cache_size)
+    return service
+
+
+def test_batch_embeddings_keep_input_order_and_encode_duplicates_once() -> None:
+    service = _huggingface_service(cache_size=10)
+    texts = ["alpha", "b", "alpha", "banana"]
+
+    embeddings = asyncio.run(service.generate_embeddings_batch(texts))
+
+    assert embeddings == _fake_encode(texts).tolist()
+    service.tokenizer.encode.assert_called_once_with(["alpha", "b", "banana"], batch_size=32)
+    assert service.get_stats()["cache_hits"] == 1
+
+
+def test_batch_embeddings_reuse_cached_vectors() -> None:
+    service = _huggingface_service(cache_size=10)
+    asyncio.run(service.generate_embeddings_batch(["alpha", "b"]))
+
+    embeddings = asyncio.run(service.generate_embeddings_batch(["b", "gamma", "alpha"]))
+
+    assert embeddings == _fake_encode(["b", "gamma", "alpha"]).tolist()
+    assert service.tokenizer.encode.call_args_list[-1].args == (["gamma"],)
+    assert service.get_stats()["cache_hits"] == 2
+
+
+def test_batch_embeddings_evict_least_recently_used() -> None:
+    service = _huggingface_service(cache_size=2)
+    asyncio.run(service.generate_embeddings_batch(["alpha", "b"]))
+    asyncio.run(service.generate_embeddings_batch(["alpha"]))  # "b" is now least recently used
+    asyncio.run(service.generate_embeddings_batch(["gamma"]))
+
+    service.tokenizer.encode.reset_mock()
+    asyncio.run(service.generate_embeddings_batch(["alpha", "gamma", "b"]))
+
+    service.tokenizer.encode.assert_called_once_with(["b"], batch_size=32)
+
+
+def test_batch_embeddings_survive_eviction_during_encode() -> None:
+    service = _huggingface_service(cache_size=2)
+    asyncio.run(service.generate_embeddings_batch(["alpha"]))
+
+    def encode_while_cache_is_cleared(texts: List[str], batch_size: int = 32) -> np.ndarray:
+        # Simulates a concurrent parse evicting this batch's cache hit mid-encode
+        service._embedding_cache.clear()
+        return _fake_encode(texts, batch_size)
+
+    service.tokenizer.encode.side_effect = encode_while_cache_is_cleared
+
+    embeddings = asyncio.run(service.generate_embeddings_batch(["alpha", "b"]))
+
+    assert embeddings == _fake_encode(["alpha", "b"]).tolist()
+
+
 if __name__ == "__main__":
+    # Initialize services
+    sentence_transformers = HuggingFaceEmbeddingService()
+    bge_service = BGEEmbeddingService()
+    gemini_service = GeminiEmbeddingService()
+    openai_service = OpenAIEmbeddings()
+    qwen_service = Qwen3EmbeddingService()
+
     texts = {
         # "AI_Research": """
         # Artificial intelligence has transformed numerous industries over the past decade,
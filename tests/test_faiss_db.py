@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from src.exceptions.faiss_exceptions import (
+    FAISSDimensionMismatchException,
+    FAISSUnableToIndexException,
+)
+from src.services.vector_store.faiss_db import FAISSVectorStore
+
+
+def test_index_embeddings_batch_keeps_input_order() -> None:
+    store = FAISSVectorStore(embedding_dimension=3)
+
+    asyncio.run(store.index_embeddings_batch([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]))
+
+    assert store.index.ntotal == 3
+    assert store.stats["vectors_added"] == 3
+    for position, query in enumerate([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]):
+        result = asyncio.run(store.search_index(query, top_k=1))
+        assert result["indices"] == [position]
+
+
+def test_index_embeddings_batch_with_no_embeddings_is_a_no_op() -> None:
+    store = FAISSVectorStore(embedding_dimension=3)
+
+    asyncio.run(store.index_embeddings_batch([]))
+
+    assert store.index.ntotal == 0
+    assert store.stats["vectors_added"] == 0
+
+
+def test_index_embeddings_batch_rejects_wrong_dimension() -> None:
+    store = FAISSVectorStore(embedding_dimension=3)
+
+    with pytest.raises(FAISSUnableToIndexException) as exc_info:
+        asyncio.run(store.index_embeddings_batch([[1.0, 0.0, 0.0, 0.0]]))
+
+    assert isinstance(exc_info.value.__cause__, FAISSDimensionMismatchException)
+    assert store.index.ntotal == 0
@@ -0,0 +1,81 @@
+import asyncio
+import time
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+
+from docx import Document as DocxDocument
+
+from src.schemas.playbook_review import TextInfo
+from src.services.ingestion.ingestion import IngestionService
+from src.services.session_manager import SessionData
+from src.services.vector_store.faiss_db import FAISSVectorStore
+from tests.test_semantic_parser import DIMENSION, _contract, _fake_vector, _parser
+
+
+def _ingestion_service() -> IngestionService:
+    """IngestionService whose registry returns the fake-embedding semantic parser."""
+    service = IngestionService.__new__(IngestionService)
+    parser = _parser()
+    service.registry = MagicMock()
+    service.registry.get_parser.return_value = parser
+    service.embedding_service = parser.embedding_service
+    # Awaitable, so a second per-chunk embedding pass would show up as extra vectors
+    service.embedding_service.generate_embeddings = AsyncMock(side_effect=lambda text, task=None: _fake_vector(text))
+    return service
+
+
+def _session() -> SessionData:
+    now = time.time()
+    return SessionData(session_id="test", created_at=now, last_access=now, vector_store=FAISSVectorStore(embedding_dimension=DIMENSION))
+
+
+def _docx_bytes(document: DocxDocument) -> BytesIO:
+    buffer = BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def _amendment() -> DocxDocument:
+    document = DocxDocument()
+    document.add_heading("1. Amendment", level=1)
+    document.add_paragraph("The Term is extended by twelve months from the original expiry date.")
+    document.add_paragraph("All other provisions of the Agreement remain unchanged and in full force.")
+    return document
+
+
+def _assert_vectors_match_chunk_store(session: SessionData) -> None:
+    assert session.vector_store.index.ntotal == len(session.chunk_store)
+    for position, chunk in session.chunk_store.items():
+        search = asyncio.run(session.vector_store.search_index(_fake_vector(chunk.content), top_k=1))
+        assert search["indices"] == [position]
+
+
+def test_parse_data_indexes_each_document_chunk_once() -> None:
+    service = _ingestion_service()
+    session = _session()
+
+    # Two uploads into one session: vector positions must keep matching chunk store keys
+    first = asyncio.run(service._parse_data(data=_docx_bytes(_contract()), session_data=session))
+    second = asyncio.run(service._parse_data(data=_docx_bytes(_amendment()), session_data=session))
+
+    assert first.success and second.success
+    assert len(session.chunk_store) == len(first.chunks) + len(second.chunks)
+    _assert_vectors_match_chunk_store(session)
+    service.embedding_service.generate_embeddings.assert_not_called()
+
+
+def test_parse_data_indexes_structured_paragraphs_into_the_session() -> None:
+    service = _ingestion_service()
+    session = _session()
+    data = [
+        TextInfo(text="The Supplier shall deliver the Goods.", paraindetifier="p1"),
+        TextInfo(text="", paraindetifier="p2"),
+        TextInfo(text="Payment is due within 30 days.", paraindetifier="p3"),
+    ]
+
+    result = asyncio.run(service._parse_data(data=data, session_data=session))
+
+    assert [chunk.content for chunk in result.chunks] == ["The Supplier shall deliver the Goods.", "Payment is due within 30 days."]
+    _assert_vectors_match_chunk_store(session)
+    service.embedding_service.generate_embeddings.assert_not_called()
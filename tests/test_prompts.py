@@ -0,0 +1,23 @@
+from src.services.prompts.v1 import truncate_document
+
+
+def test_short_document_is_returned_unchanged() -> None:
+    text = "First clause.\n\nSecond clause."
+
+    assert truncate_document(text, max_chars=len(text)) == text
+
+
+def test_long_document_is_cut_at_last_paragraph_boundary() -> None:
+    text = "1. Definitions apply.\n\n2. Term is one year.\n\n3. Limitation of liability."
+
+    result = truncate_document(text, max_chars=50)
+
+    assert result == "1. Definitions apply.\n\n2. Term is one year.\n\n[Document truncated: 43 of 72 characters shown]"
+
+
+def test_cut_falls_back_to_a_word_boundary_without_paragraph_breaks() -> None:
+    text = "The Supplier shall indemnify the Customer"
+
+    result = truncate_document(text, max_chars=20)
+
+    assert result == "The Supplier shall\n\n[Document truncated: 18 of 41 characters shown]"
@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+from docx import Document as DocxDocument
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from src.config.settings import get_settings
+from src.services.registry.semantic_parser import (
+    DocxParser,
+    _iter_block_items,
+    _paragraph_style_key,
+)
+from src.services.vector_store.faiss_db import FAISSVectorStore
+
+DIMENSION = 8
+
+
+def _fake_vector(text: str) -> List[float]:
+    """Deterministic, text-specific vector so each chunk can be found by its own content."""
+    return [byte / 255.0 + 0.01 for byte in hashlib.sha256(text.encode("utf-8")).digest()[:DIMENSION]]
+
+
+def _parser() -> DocxParser:
+    """Semantic DocxParser with a fake embedding service and a fresh FAISS store."""
+    parser = DocxParser.__new__(DocxParser)
+    parser.settings = get_settings()
+    parser.embedding_service = MagicMock(model_name="fake-model")
+    parser.embedding_service.batch_calls = []
+
+    async def generate_embeddings_batch(texts: List[str], task: Optional[str] = None) -> List[List[float]]:
+        parser.embedding_service.batch_calls.append((list(texts), task))
+        return [_fake_vector(text) for text in texts]
+
+    parser.embedding_service.generate_embeddings_batch = generate_embeddings_batch
+    parser.vector_store = FAISSVectorStore(embedding_dimension=DIMENSION)
+    return parser
+
+
+def _contract() -> DocxDocument:
+    document = DocxDocument()
+    document.add_heading("1. Definitions", level=1)
+    document.add_paragraph("Confidential Information means any information disclosed by either party.")
+    document.add_paragraph("Affiliate means any entity controlling or controlled by a party.")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Party"
+    table.cell(0, 1).text = "Role"
+    table.cell(1, 0).text = "Acme Ltd"
+    table.cell(1, 1).text = "Supplier"
+    document.add_heading("2. Term", level=1)
+    document.add_paragraph("This Agreement remains in force for two years from the Effective Date.")
+    return document
+
+
+def test_iter_block_items_yields_paragraphs_and_tables_in_body_order() -> None:
+    document = _contract()
+
+    blocks = list(_iter_block_items(document))
+
+    assert [type(block) for block in blocks] == [Paragraph, Paragraph, Paragraph, Table, Paragraph, Paragraph]
+    assert [block.text for block in blocks if isinstance(block, Paragraph)] == [p.text for p in document.paragraphs]
+    assert len([block for block in blocks if isinstance(block, Table)]) == len(document.tables)
+
+
+def test_parse_document_indexes_one_vector_per_chunk_in_chunk_order() -> None:
+    parser = _parser()
+
+    result = asyncio.run(parser.parse_document(_contract()))
+
+    assert result.success, result.error_message
+    assert parser.vector_store.index.ntotal == len(result.chunks)
+    for chunk in result.chunks:
+        search = asyncio.run(parser.vector_store.search_index(_fake_vector(chunk.content), top_k=1))
+        assert search["indices"] == [chunk.chunk_index]
+
+
+def test_parse_document_embeds_tables_with_the_default_task() -> None:
+    parser = _parser()
+
+    result = asyncio.run(parser.parse_document(_contract()))
+
+    table_texts = [chunk.content for chunk in result.chunks if chunk.metadata["chunk_type"] == "table"]
+    chunk_texts = [chunk.content for chunk in result.chunks if chunk.metadata["chunk_type"] != "table"]
+    # The first batch call embeds paragraphs for semantic splitting; the rest embed chunks
+    assert parser.embedding_service.batch_calls[1:] == [(chunk_texts, "text-matching"), (table_texts, None)]
+
+
+def test_extract_paragraphs_detects_styled_and_structural_headings() -> None:
+    document = DocxDocument()
+    document.add_heading("Definitions and interpretation of this agreement in full", level=1)
+    document.add_paragraph("GOVERNING LAW")
+    document.add_paragraph("The Supplier shall deliver the Goods on the Delivery Date.")
+    document.add_paragraph("   ")
+    document.add_heading("Term", level=2)
+
+    paragraphs, word_count = _parser()._extract_paragraphs(document.paragraphs)
+
+    assert [(p["content"], p["is_heading"]) for p in paragraphs] == [
+        ("Definitions and interpretation of this agreement in full", True),
+        ("GOVERNING LAW", True),
+        ("The Supplier shall deliver the Goods on the Delivery Date.", False),
+        ("Term", True),
+    ]
+    assert word_count == 21
+
+
+def test_paragraph_style_key_identifies_each_style() -> None:
+    document = DocxDocument()
+    heading = document.add_heading("Term", level=1)
+    body = document.add_paragraph("Body text.")
+    bullet = document.add_paragraph("Item", style="List Bullet")
+
+    assert _paragraph_style_key(heading) == "Heading1"
+    assert _paragraph_style_key(body) is None
+    assert _paragraph_style_key(bullet) == "ListBullet"